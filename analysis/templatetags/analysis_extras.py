@@ -0,0 +1,18 @@
+from django import template
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+register = template.Library()
+
+@register.filter
+def jsonpretty(value):
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    return json.dumps(value, indent=2)
@@ -0,0 +1,143 @@
+import random
+import re
+import threading
+
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase
+
+from analysis.views import (
+    DASHBOARD_CACHE_KEY, ActionCommand, DataContextService, ActionType, ClassificationResult, ClassificationType, TestResult,
+    _DATA_SERVICE, _find_ansible_role, dashboard_view, parse_ginkgo_steps,
+)
+
+_BASELINE_ANSIBLE_RE = re.compile(r"ansible-playbook error.*use_role\":\"([^\"]+)\"", re.DOTALL)
+
+def _baseline_ansible_role(logs):
+    match = _BASELINE_ANSIBLE_RE.search(logs)
+    return match.group(1).split('/')[-1] if match else None
+
+def _baseline_parse_ginkgo_steps(logs):
+    all_steps = re.findall(r"STEP: (.*)", logs)
+    ignore_list = ["setting up environment", "cleaning up resources", "starting test"]
+    filtered_steps = [s for s in all_steps if not any(ignore_phrase in s.lower() for ignore_phrase in ignore_list)]
+    failure_keywords = ["FAIL", "panic", "error", "fatal"]
+    last_step = "Log analysis did not find a failed step"
+    for line in logs.split('\n'):
+        if line.startswith("STEP:"):
+            step_text = line.replace("STEP: ", "").strip()
+            if not any(ignore_phrase in step_text.lower() for ignore_phrase in ignore_list):
+                last_step = step_text
+        if any(keyword in line.lower() for keyword in failure_keywords):
+            break
+    return filtered_steps, last_step
+
+class ParseGinkgoStepsTests(SimpleTestCase):
+    fragments = [
+        "STEP: Deploy app", "STEP: setting up environment", "STEP: Verify backup integrity  ", "STEP: Starting test now",
+        "STEP: Cleaning up resources", "STEP: check error handling", "STEP: a STEP: b", "STEP: a\r", "STEP: ", "STEP:",
+        "STEP:nospace", "STEP:nospace STEP: x", "  STEP: indented", "xx STEP: mid", "INFO: ok", "ERROR: boom",
+        "FAIL: x", "panic: nil", "Fatal thing", "WARN: Connection timed out", "random text with Error inside", "",
+        "STEP: İnit", "İ panıc here", "FATAL ſtop", "erroR İ", "STEP: ſetting up environment", "STEP: SETTİNG UP ENVIRONMENT", "STEP: Kelvin K", "Σ error Σ",
+    ]
+
+    def assert_matches_baseline(self, logs):
+        self.assertEqual(parse_ginkgo_steps(logs), _baseline_parse_ginkgo_steps(logs), repr(logs))
+
+    def test_step_without_space(self):
+        self.assert_matches_baseline("STEP:")
+        self.assert_matches_baseline("STEP:nospace\nERROR: boom")
+
+    def test_length_changing_lowercase_keeps_per_line_semantics(self):
+        self.assert_matches_baseline("STEP: İnit\nSTEP: a\npanıc\nSTEP: b\nerror")
+        self.assert_matches_baseline("İ\nSTEP: a\nPANIC\nSTEP: b")
+
+    def test_matches_baseline_on_random_logs(self):
+        rng = random.Random(1)
+        for _ in range(50000):
+            self.assert_matches_baseline("\n".join(rng.choice(self.fragments) for _ in range(rng.randint(0, 8))))
+
+class FindAnsibleRoleTests(SimpleTestCase):
+    cases = [
+        'ansible-playbook error: host failed... use_role":"roles/ocp-datagrid"',
+        'ansible-playbook error ... use_role":"roles/a" ... use_role":"',
+        'ansible-playbook error ... use_role":"roles/a" ... use_role":""',
+        'ansible-playbook error ... use_role":"roles/a" ... use_role":"roles/b"',
+        'ansible-playbook error ... use_role":"roles/a"\n... use_role":"roles/b" ... use_role":"',
+        'ansible-playbook error ... use_role":""',
+        'ansible-playbook error ... use_role":"',
+        'ansible-playbook error ... use_role":"multi\nline" tail',
+        'use_role":"roles/before" ansible-playbook error ... no role',
+        'ansible-playbook erroruse_role":"roles/adjacent"',
+        'ansible-playbook error ... ansible-playbook error ... use_role":"roles/c"',
+        'no ansible failure here use_role":"roles/x"',
+        '',
+    ]
+
+    def test_matches_baseline_regex(self):
+        for logs in self.cases:
+            with self.subTest(logs=logs):
+                self.assertEqual(_find_ansible_role(logs), _baseline_ansible_role(logs))
+
+    def test_matches_baseline_regex_on_random_fragments(self):
+        fragments = ['ansible-playbook error', 'use_role":"', 'use_role":', 'roles/a', '"', '/', 'x', '\n']
+        rng = random.Random(3)
+        for _ in range(20000):
+            logs = ''.join(rng.choice(fragments) for _ in range(rng.randint(0, 10)))
+            self.assertEqual(_find_ansible_role(logs), _baseline_ansible_role(logs), logs)
+
+class DashboardCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.delete(DASHBOARD_CACHE_KEY)
+
+    def cached_run_ids(self):
+        return re.findall(r'/logs/([0-9a-f]+)/', cache.get(DASHBOARD_CACHE_KEY).content.decode())
+
+    def test_overlapping_cold_requests_cache_a_page_whose_runs_exist(self):
+        factory, barrier = RequestFactory(), threading.Barrier(4)
+        def hit(path):
+            barrier.wait()
+            dashboard_view(factory.get(path))
+        threads = [threading.Thread(target=hit, args=(path,)) for path in ('/', '/', '/?refresh=1', '/?refresh=1')]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        run_ids = self.cached_run_ids()
+        self.assertTrue(run_ids)
+        self.assertTrue(all(_DATA_SERVICE.get_test_result(run_id) for run_id in run_ids))
+
+    def test_refresh_replaces_cached_page(self):
+        dashboard_view(RequestFactory().get('/'))
+        first = self.cached_run_ids()
+        dashboard_view(RequestFactory().get('/?refresh=1'))
+        self.assertNotEqual(first, self.cached_run_ids())
+
+class TestResultToDictTests(SimpleTestCase):
+    def test_serializes_analysis_objects_and_leaves_plain_lists(self):
+        result = TestResult("t", "suite", "build", "env", "logs", "1.0", "main", "AWS")
+        result.analysis.update({
+            "classifications": [ClassificationResult("ID", ClassificationType.KNOWN_FLAKE, 0.9, {"ticket": "PROJ-1"})],
+            "actions": [ActionCommand(ActionType.MARK_FOR_RERUN, {"reason": "flaky"})],
+            "action_results": [{"action_type": "Mark for Rerun"}],
+            "notes": ["plain", 1],
+        })
+        analysis = result.to_dict()["analysis"]
+        self.assertEqual(analysis["classifications"], [{"classifier_id": "ID", "classification_type": "Known Flake", "confidence": 0.9, "details": {"ticket": "PROJ-1"}}])
+        self.assertEqual(analysis["actions"], [{"action_type": "Mark for Rerun", "payload": {"reason": "flaky"}}])
+        self.assertEqual(analysis["action_results"], [{"action_type": "Mark for Rerun"}])
+        self.assertEqual(analysis["notes"], ["plain", 1])
+
+class DataContextServiceTests(SimpleTestCase):
+    def make_result(self, test_run_id):
+        return TestResult("t", "suite", "build", "env", "logs", "1.0", "main", "AWS", test_run_id=test_run_id)
+
+    def test_instances_do_not_share_state(self):
+        first, second = DataContextService(), DataContextService()
+        first.save_test_result(self.make_result("a"))
+        self.assertEqual(first.get_view_row("a")["test_run_id"], "a")
+        self.assertIsNone(second.get_test_result("a"))
+        self.assertIsNone(second.get_view_row("a"))
+
+    def test_evicts_oldest_results_past_the_cap(self):
+        service = DataContextService(max_results=2)
+        for test_run_id in ("a", "b", "c"):
+            service.save_test_result(self.make_result(test_run_id))
+        self.assertEqual([row["test_run_id"] for row in service.get_view_rows()], ["b", "c"])
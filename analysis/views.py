@@ -1,14 +1,21 @@
 from django.shortcuts import render, get_object_or_404
 from django.http import Http404
+from django.core.cache import cache
+from django.conf import settings
+from collections import OrderedDict
+import functools
 import re
+import threading
 import time
 import uuid
 import json
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Callable
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Callable, Tuple
 
-SIMULATION_DB = {}
+SIMULATION_DB_MAX = getattr(settings, 'ANALYSIS_SIMULATION_DB_MAX', 1000)
+_FLOW_LOG_ENABLED = getattr(settings, 'ANALYSIS_FLOW_LOG', True)
 
 class ClassificationType(Enum):
     KNOWN_FLAKE = "Known Flake"
@@ -28,22 +35,46 @@ class ClassificationType(Enum):
     KNOWN_AUTOMATION_ISSUE_OADP_2345 = "known-automation-issue-oadp-2345"
     NEEDS_MANUAL_REVIEW = "Needs Manual Review"
 
-@dataclass
+_ANALYSIS_OBJECT_KEYS = frozenset({'classifications', 'actions'})
+
+@dataclass(slots=True)
 class TestResult:
     test_name: str; suite: str; build_id: str; environment: str; logs: str
     oadp_version: str; repository: str; env_platform: str
     tags: List[str] = field(default_factory=list)
-    test_run_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    test_run_id: str = field(default_factory=lambda: uuid.uuid4().hex)
     rerun_count: int = 0
     steps: List[str] = field(default_factory=list)
     failed_step: Optional[str] = None
     analysis: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'test_name': self.test_name, 'suite': self.suite, 'build_id': self.build_id, 'environment': self.environment, 'logs': self.logs,
+            'oadp_version': self.oadp_version, 'repository': self.repository, 'env_platform': self.env_platform,
+            'tags': list(self.tags), 'test_run_id': self.test_run_id, 'rerun_count': self.rerun_count,
+            'steps': list(self.steps), 'failed_step': self.failed_step,
+            'analysis': self._analysis_to_dict(),
+        }
+
+    def _analysis_to_dict(self) -> Dict[str, Any]:
+        analysis = {}
+        for key, value in self.analysis.items():
+            if key in _ANALYSIS_OBJECT_KEYS:
+                value = [item.to_dict() for item in value]
+            elif isinstance(value, list):
+                value = [dict(item) if isinstance(item, dict) else item for item in value]
+            analysis[key] = value
+        return analysis
+
+@dataclass(frozen=True, slots=True)
 class ClassificationResult:
     classifier_id: str; classification_type: ClassificationType; confidence: float
     details: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {'classifier_id': self.classifier_id, 'classification_type': self.classification_type.value, 'confidence': self.confidence, 'details': dict(self.details)}
+
 class ActionType(Enum):
     CREATE_JIRA_TICKET = "Create Jira Ticket"
     UPDATE_JIRA_TICKET = "Update Jira Ticket"
@@ -53,39 +84,139 @@ class ActionType(Enum):
     RUN_CUSTOM_SCRIPT = "Run Custom Script"
     DO_NOTHING = "Do Nothing"
 
-@dataclass
+@dataclass(slots=True)
 class ActionCommand:
     action_type: ActionType; payload: Dict[str, Any]
 
-def parse_ginkgo_steps(logs: str) -> (List[str], Optional[str]):
-    all_steps = re.findall(r"STEP: (.*)", logs)
-    ignore_list = ["setting up environment", "cleaning up resources", "starting test"]
-    filtered_steps = [s for s in all_steps if not any(ignore_phrase in s.lower() for ignore_phrase in ignore_list)]
-    failure_keywords = ["FAIL", "panic", "error", "fatal"]
+    def to_dict(self) -> Dict[str, Any]:
+        return {'action_type': self.action_type.value, 'payload': dict(self.payload)}
+
+_STEP_RE = re.compile(r"STEP:.*")
+_FAILURE_KEYWORDS = ("panic", "error", "fatal")
+_IGNORE_STEP_RE = re.compile("|".join(map(re.escape, ["setting up environment", "cleaning up resources", "starting test"])), re.IGNORECASE | re.ASCII)
+
+def _first_failure_offset(logs: str) -> int:
+    lowered = logs.lower()
+    if len(lowered) == len(logs):
+        return min((i for i in map(lowered.find, _FAILURE_KEYWORDS) if i >= 0), default=len(logs))
+    offset = 0
+    for line in logs.split('\n'):
+        line_lower = line.lower()
+        if any(keyword in line_lower for keyword in _FAILURE_KEYWORDS): return offset
+        offset += len(line) + 1
+    return len(logs)
+
+@functools.lru_cache(maxsize=SIMULATION_DB_MAX)
+def _parse_ginkgo_steps_cached(logs: str) -> Tuple[Tuple[str, ...], str]:
+    filtered_steps = []
     last_step = "Log analysis did not find a failed step"
-    log_lines = logs.split('\n')
-    for line in log_lines:
-        if line.startswith("STEP:"):
-            step_text = line.replace("STEP: ", "").strip()
-            if not any(ignore_phrase in step_text.lower() for ignore_phrase in ignore_list):
+    cutoff = _first_failure_offset(logs)
+    for step in _STEP_RE.finditer(logs):
+        step_line, start = step.group(0), step.start()
+        marker = step_line.find("STEP: ")
+        if marker >= 0 and not _IGNORE_STEP_RE.search(step_line, marker + 6):
+            filtered_steps.append(step_line[marker + 6:])
+        if start <= cutoff and (start == 0 or logs[start - 1] == "\n"):
+            step_text = step_line.replace("STEP: ", "").strip()
+            if not _IGNORE_STEP_RE.search(step_text):
                 last_step = step_text
-        if any(keyword in line.lower() for keyword in failure_keywords):
-            break
-    return filtered_steps, last_step
+    return tuple(filtered_steps), last_step
+
+def parse_ginkgo_steps(logs: str) -> (List[str], Optional[str]):
+    filtered_steps, last_step = _parse_ginkgo_steps_cached(logs)
+    return list(filtered_steps), last_step
 
 class DataContextService:
-    _instance = None
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(DataContextService, cls).__new__(cls)
-            cls._instance._db = SIMULATION_DB
-        return cls._instance
-    def save_test_result(self, result: TestResult): self._db[result.test_run_id] = result
+    def __init__(self, max_results: int = SIMULATION_DB_MAX):
+        self._db, self._serialized, self._wlock = OrderedDict(), {}, threading.Lock()
+        self._max_results = max_results
+    def save_test_result(self, result: TestResult):
+        with self._wlock:
+            self._db[result.test_run_id] = result
+            self._db.move_to_end(result.test_run_id)
+            self._serialized.pop(result.test_run_id, None)
+            while len(self._db) > self._max_results:
+                evicted_id, _ = self._db.popitem(last=False)
+                self._serialized.pop(evicted_id, None)
     def get_test_result(self, test_run_id: str): return self._db.get(test_run_id)
     def update_analysis(self, test_run_id: str, analysis_data: Dict[str, Any]):
-        if test_run_id in self._db: self._db[test_run_id].analysis.update(analysis_data)
+        with self._wlock:
+            if test_run_id in self._db:
+                self._db[test_run_id].analysis.update(analysis_data)
+                self._serialized.pop(test_run_id, None)
     def get_all_results(self): return list(self._db.values())
-    def clear(self): self._db.clear()
+    def _view_row(self, test_run_id: str, result: TestResult) -> Dict[str, Any]:
+        row = self._serialized.get(test_run_id)
+        if row is None: row = self._serialized[test_run_id] = result.to_dict()
+        return row
+    def get_view_row(self, test_run_id: str) -> Optional[Dict[str, Any]]:
+        with self._wlock:
+            result = self._db.get(test_run_id)
+            return self._view_row(test_run_id, result) if result else None
+    def get_view_rows(self) -> List[Dict[str, Any]]:
+        with self._wlock:
+            return [self._view_row(test_run_id, result) for test_run_id, result in self._db.items()]
+    def clear(self):
+        with self._wlock:
+            self._db.clear()
+            self._serialized.clear()
+
+_DATA_SERVICE = DataContextService()
+
+_BY_CONFIDENCE = attrgetter('confidence')
+_SKIP_TYPES = frozenset({ClassificationType.SKIP, ClassificationType.NEW_SKIP})
+_KNOWN_TICKET_TYPES = frozenset({ClassificationType.KNOWN_BUG_OADP_2345, ClassificationType.KNOWN_AUTOMATION_ISSUE_OADP_2345})
+
+_LITERAL_PATTERNS = tuple((literal.lower(), result) for literal, result in (
+    ("Test skipped due to unstable environment", ClassificationResult("REGEX_SKIP_ENV", ClassificationType.SKIP, 1.0, {})),
+    ("Skipping test, feature flag is disabled", ClassificationResult("REGEX_SKIP_FLAG", ClassificationType.NEW_SKIP, 1.0, {})),
+    ("Connection timed out", ClassificationResult("REGEX_TIMEOUT", ClassificationType.KNOWN_FLAKE, 0.99, {"ticket": "PROJ-123"})),
+    ("database migration setup", ClassificationResult("REGEX_DB_MIGRATE", ClassificationType.SETUP_FAILURE, 0.95, {})),
+    ("mysql validation failed", ClassificationResult("REGEX_MYSQL_VALIDATE", ClassificationType.OCP_MYSQL_VALIDATION_FAILURE, 0.96, {})),
+    ("mysql cleanup failed", ClassificationResult("REGEX_MYSQL_CLEANUP", ClassificationType.OCP_MYSQL_CLEANUP_FAILURE, 0.96, {})),
+    ("ocp-mysql deploy failed", ClassificationResult("REGEX_MYSQL_DEPLOY", ClassificationType.OCP_MYSQL_DEPLOY_FAILURE, 0.97, {})),
+    ("backup completed with warnings", ClassificationResult("REGEX_BACKUP_PARTIAL", ClassificationType.BACKUP_PARTIALLY_FAILED, 0.90, {})),
+    ("backup successful", ClassificationResult("REGEX_BACKUP_SUCCESS", ClassificationType.BACKUP_SUCCESSFUL, 1.0, {})),
+    ("error restoring snapshot oadp-2345", ClassificationResult("REGEX_KNOWN_BUG_2345", ClassificationType.KNOWN_BUG_OADP_2345, 1.0, {"ticket": "OADP-2345"})),
+    ("automation framework panicked", ClassificationResult("REGEX_KNOWN_AUTO_ISSUE_2345", ClassificationType.KNOWN_AUTOMATION_ISSUE_OADP_2345, 1.0, {"ticket": "AUTO-112"})),
+))
+_RESULT_LLM_NPE = ClassificationResult("LLM_NPE", ClassificationType.PRODUCT_BUG, 0.92, {"exception": "NullPointerException"})
+_RESULT_LLM_PERMS = ClassificationResult("LLM_PERMS", ClassificationType.INFRA_ERROR, 0.88, {"error": "Permission denied"})
+_RESULT_DEFAULT_REVIEW = ClassificationResult("DEFAULT_REVIEW", ClassificationType.NEEDS_MANUAL_REVIEW, 0.5, {})
+_ANSIBLE_MARKER = "ansible-playbook error"
+_ANSIBLE_ROLE_KEY = 'use_role":"'
+
+def _find_ansible_role(logs: str) -> Optional[str]:
+    start = logs.find(_ANSIBLE_MARKER)
+    if start < 0: return None
+    start += len(_ANSIBLE_MARKER)
+    end = len(logs)
+    while True:
+        key = logs.rfind(_ANSIBLE_ROLE_KEY, start, end)
+        if key < 0: return None
+        value_start = key + len(_ANSIBLE_ROLE_KEY)
+        value_end = logs.find('"', value_start)
+        if value_end > value_start: return logs[value_start:value_end].split('/')[-1]
+        end = value_start - 1
+
+@functools.lru_cache(maxsize=SIMULATION_DB_MAX)
+def _match_log_patterns(logs: str) -> Tuple[Tuple[str, ClassificationResult], ...]:
+    found = []
+    logs_lower = logs.lower()
+    for literal, result in _LITERAL_PATTERNS:
+        if literal in logs_lower:
+            if result.classification_type in _SKIP_TYPES: return ((result.classifier_id, result),)
+            found.append((result.classifier_id, result))
+
+    failed_role = _find_ansible_role(logs)
+    if failed_role is not None:
+        found.append(("REGEX_ANSIBLE_FAILURE", ClassificationResult("REGEX_ANSIBLE_FAILURE", ClassificationType.ANSIBLE_DEPLOY_FAILURE, 0.98, {"failed_role": failed_role})))
+
+    if "nullpointerexception" in logs_lower:
+        found.append(("LLM_NPE (PRODUCT_BUG)", _RESULT_LLM_NPE))
+    if "permission denied" in logs_lower:
+        found.append(("LLM_PERMS (INFRA_ERROR)", _RESULT_LLM_PERMS))
+    return tuple(found)
 
 class ClassifierEngine:
     def __init__(self, data_service: DataContextService, flow_log: List[str]):
@@ -94,64 +225,49 @@ class ClassifierEngine:
     def _step_based_classifier(self, test_name: str, failed_step: Optional[str]) -> List[ClassificationResult]:
         if not failed_step: return []
         if "test_mysql_backup" in test_name and "Verify backup integrity" in failed_step:
-            self.flow_log.append("   [Classifier] Match: STEP_BACKUP_INTEGRITY")
+            if _FLOW_LOG_ENABLED: self.flow_log.append("   [Classifier] Match: STEP_BACKUP_INTEGRITY")
             return [ClassificationResult("STEP_BACKUP_INTEGRITY", ClassificationType.BACKUP_INTEGRITY_FAILURE, 1.0, {"reason": "Checksum mismatch", "failed_step": failed_step})]
         return []
 
-    def _regex_classifier(self, logs: str) -> List[ClassificationResult]:
-        found = []
-        patterns = {
-            "Connection timed out": ClassificationResult("REGEX_TIMEOUT", ClassificationType.KNOWN_FLAKE, 0.99, {"ticket": "PROJ-123"}),
-            "database migration setup": ClassificationResult("REGEX_DB_MIGRATE", ClassificationType.SETUP_FAILURE, 0.95, {}),
-            "mysql validation failed": ClassificationResult("REGEX_MYSQL_VALIDATE", ClassificationType.OCP_MYSQL_VALIDATION_FAILURE, 0.96, {}),
-            "mysql cleanup failed": ClassificationResult("REGEX_MYSQL_CLEANUP", ClassificationType.OCP_MYSQL_CLEANUP_FAILURE, 0.96, {}),
-            "ocp-mysql deploy failed": ClassificationResult("REGEX_MYSQL_DEPLOY", ClassificationType.OCP_MYSQL_DEPLOY_FAILURE, 0.97, {}),
-            "backup completed with warnings": ClassificationResult("REGEX_BACKUP_PARTIAL", ClassificationType.BACKUP_PARTIALLY_FAILED, 0.90, {}),
-            "backup successful": ClassificationResult("REGEX_BACKUP_SUCCESS", ClassificationType.BACKUP_SUCCESSFUL, 1.0, {}),
-            "Test skipped due to unstable environment": ClassificationResult("REGEX_SKIP_ENV", ClassificationType.SKIP, 1.0, {}),
-            "Skipping test, feature flag is disabled": ClassificationResult("REGEX_SKIP_FLAG", ClassificationType.NEW_SKIP, 1.0, {}),
-            "error restoring snapshot oadp-2345": ClassificationResult("REGEX_KNOWN_BUG_2345", ClassificationType.KNOWN_BUG_OADP_2345, 1.0, {"ticket": "OADP-2345"}),
-            "automation framework panicked": ClassificationResult("REGEX_KNOWN_AUTO_ISSUE_2345", ClassificationType.KNOWN_AUTOMATION_ISSUE_OADP_2345, 1.0, {"ticket": "AUTO-112"}),
-        }
-        for pattern, result in patterns.items():
-            if re.search(pattern, logs, re.IGNORECASE):
-                self.flow_log.append(f"   [Classifier] Match: {result.classifier_id}")
-                found.append(result)
-
-        ansible_match = re.search(r"ansible-playbook error.*use_role\":\"([^\"]+)\"", logs, re.DOTALL)
-        if ansible_match:
-            failed_role = ansible_match.group(1).split('/')[-1]
-            self.flow_log.append("   [Classifier] Match: REGEX_ANSIBLE_FAILURE")
-            found.append(ClassificationResult("REGEX_ANSIBLE_FAILURE", ClassificationType.ANSIBLE_DEPLOY_FAILURE, 0.98, {"failed_role": failed_role}))
-        return found
-
-    def _llm_classifier(self, logs: str) -> List[ClassificationResult]:
+    def _classify_logs(self, logs: str) -> List[ClassificationResult]:
         found = []
-        if "nullpointerexception" in logs.lower():
-            self.flow_log.append("   [Classifier] Match: LLM_NPE (PRODUCT_BUG)")
-            found.append(ClassificationResult("LLM_NPE", ClassificationType.PRODUCT_BUG, 0.92, {"exception": "NullPointerException"}))
-        if "permission denied" in logs.lower():
-            self.flow_log.append("   [Classifier] Match: LLM_PERMS (INFRA_ERROR)")
-            found.append(ClassificationResult("LLM_PERMS", ClassificationType.INFRA_ERROR, 0.88, {"error": "Permission denied"}))
+        for label, result in _match_log_patterns(logs):
+            if _FLOW_LOG_ENABLED: self.flow_log.append(f"   [Classifier] Match: {label}")
+            found.append(result)
         return found
 
     def classify(self, test_run_id: str) -> List[ClassificationResult]:
         test_result = self._data_service.get_test_result(test_run_id)
         if not test_result: return []
-        self.flow_log.append(f"-> Classifying '{test_result.test_name}'...")
-        all_classifications = self._regex_classifier(test_result.logs) + self._llm_classifier(test_result.logs) + self._step_based_classifier(test_result.test_name, test_result.failed_step)
+        if _FLOW_LOG_ENABLED: self.flow_log.append(f"-> Classifying '{test_result.test_name}'...")
+        all_classifications = self._classify_logs(test_result.logs) + self._step_based_classifier(test_result.test_name, test_result.failed_step)
         
-        skip_classifications = [c for c in all_classifications if c.classification_type in [ClassificationType.SKIP, ClassificationType.NEW_SKIP]]
-        if skip_classifications:
-            self.flow_log.append("   [Classifier] Exclusive 'skip' classification found. Overriding others.")
-            return [skip_classifications[0]]
+        skip_classification = next((c for c in all_classifications if c.classification_type in _SKIP_TYPES), None)
+        if skip_classification:
+            if _FLOW_LOG_ENABLED: self.flow_log.append("   [Classifier] Exclusive 'skip' classification found. Overriding others.")
+            return [skip_classification]
 
         if not all_classifications:
-            self.flow_log.append("   [Classifier] No specific match. Defaulting to Needs Manual Review.")
-            return [ClassificationResult("DEFAULT_REVIEW", ClassificationType.NEEDS_MANUAL_REVIEW, 0.5, {})]
+            if _FLOW_LOG_ENABLED: self.flow_log.append("   [Classifier] No specific match. Defaulting to Needs Manual Review.")
+            return [_RESULT_DEFAULT_REVIEW]
         
         unique = {c.classifier_id: c for c in all_classifications}
-        return sorted(list(unique.values()), key=lambda x: x.confidence, reverse=True)
+        return sorted(unique.values(), key=_BY_CONFIDENCE, reverse=True)
+
+def _update_known_ticket(test: TestResult, c: ClassificationResult) -> List[ActionCommand]:
+    return [ActionCommand(ActionType.UPDATE_JIRA_TICKET, {"ticket": c.details["ticket"]})]
+
+_RULE_HANDLERS: Dict[ClassificationType, Callable[[TestResult, ClassificationResult], List[ActionCommand]]] = {
+    ClassificationType.PRODUCT_BUG: lambda test, c: [ActionCommand(ActionType.CREATE_JIRA_TICKET, {"test_name": test.test_name})],
+    **{classification_type: _update_known_ticket for classification_type in _KNOWN_TICKET_TYPES},
+    ClassificationType.BACKUP_INTEGRITY_FAILURE: lambda test, c: [ActionCommand(ActionType.NOTIFY_SLACK, {"channel": "#storage-team", "details": c.details})],
+    ClassificationType.ANSIBLE_DEPLOY_FAILURE: lambda test, c: [ActionCommand(ActionType.NOTIFY_SLACK, {"channel": "#devops-ansible", "failed_role": c.details["failed_role"]})],
+    ClassificationType.KNOWN_FLAKE: lambda test, c: [ActionCommand(ActionType.MARK_FOR_RERUN, {"reason": "Known flaky test"})],
+    ClassificationType.INFRA_ERROR: lambda test, c: [
+        ActionCommand(ActionType.RUN_CUSTOM_SCRIPT, {"script_path": "/scripts/cleanup_stale_resources.sh"}),
+        ActionCommand(ActionType.MARK_FOR_MANUAL_REVIEW, {"reason": "Infrastructure instability"}),
+    ],
+}
 
 class DecisionEngine:
     def __init__(self, classifier: ClassifierEngine, data_service: DataContextService, flow_log: List[str]):
@@ -163,37 +279,30 @@ class DecisionEngine:
         self._data_service.save_test_result(test_result)
         
         classifications = self._classifier.classify(test_result.test_run_id)
-        self.flow_log.append(f"   [DecisionEngine] Received {len(classifications)} classification(s). Applying rules...")
+        if _FLOW_LOG_ENABLED: self.flow_log.append(f"   [DecisionEngine] Received {len(classifications)} classification(s). Applying rules...")
         action_commands = self._apply_rules(test_result, classifications)
-        self._data_service.update_analysis(test_result.test_run_id, {"classifications": [asdict(c) for c in classifications], "actions": [asdict(a) for a in action_commands]})
+        self._data_service.update_analysis(test_result.test_run_id, {"classifications": classifications, "actions": action_commands})
         return action_commands
 
     def _apply_rules(self, test: TestResult, classifications: List[ClassificationResult]) -> List[ActionCommand]:
-        actions = []
+        actions, seen = [], set()
         primary_classification = classifications[0] if classifications else None
 
-        if primary_classification and primary_classification.classification_type in [ClassificationType.SKIP, ClassificationType.NEW_SKIP]:
+        if primary_classification and primary_classification.classification_type in _SKIP_TYPES:
             return [ActionCommand(ActionType.DO_NOTHING, {})]
 
         for c in classifications:
-            if c.classification_type == ClassificationType.PRODUCT_BUG:
-                actions.append(ActionCommand(ActionType.CREATE_JIRA_TICKET, {"test_name": test.test_name}))
-            elif c.classification_type in [ClassificationType.KNOWN_BUG_OADP_2345, ClassificationType.KNOWN_AUTOMATION_ISSUE_OADP_2345]:
-                actions.append(ActionCommand(ActionType.UPDATE_JIRA_TICKET, {"ticket": c.details["ticket"]}))
-            elif c.classification_type == ClassificationType.BACKUP_INTEGRITY_FAILURE:
-                 actions.append(ActionCommand(ActionType.NOTIFY_SLACK, {"channel": "#storage-team", "details": c.details}))
-            elif c.classification_type == ClassificationType.ANSIBLE_DEPLOY_FAILURE:
-                actions.append(ActionCommand(ActionType.NOTIFY_SLACK, {"channel": "#devops-ansible", "failed_role": c.details["failed_role"]}))
-            elif c.classification_type == ClassificationType.KNOWN_FLAKE:
-                actions.append(ActionCommand(ActionType.MARK_FOR_RERUN, {"reason": "Known flaky test"}))
-            elif c.classification_type == ClassificationType.INFRA_ERROR:
-                 actions.append(ActionCommand(ActionType.RUN_CUSTOM_SCRIPT, {"script_path": "/scripts/cleanup_stale_resources.sh"}))
-                 actions.append(ActionCommand(ActionType.MARK_FOR_MANUAL_REVIEW, {"reason": "Infrastructure instability"}))
+            handler = _RULE_HANDLERS.get(c.classification_type)
+            if handler is None: continue
+            for action in handler(test, c):
+                if action.action_type not in seen:
+                    seen.add(action.action_type)
+                    actions.append(action)
 
         if not actions:
             actions.append(ActionCommand(ActionType.MARK_FOR_MANUAL_REVIEW, {"reason": "No specific rule matched"}))
 
-        return list({a.action_type: a for a in actions}.values())
+        return actions
 
 class ActionExecutor:
     def __init__(self, flow_log: List[str]):
@@ -201,7 +310,7 @@ class ActionExecutor:
 
     def execute_action(self, command: ActionCommand) -> Dict:
         action_type = command.action_type
-        self.flow_log.append(f"   [ActionExecutor] Executing: {action_type.value}")
+        if _FLOW_LOG_ENABLED: self.flow_log.append(f"   [ActionExecutor] Executing: {action_type.value}")
         payload = {"action_type": action_type.value}
 
         if action_type == ActionType.CREATE_JIRA_TICKET:
@@ -220,9 +329,12 @@ class ActionExecutor:
         
         return payload
 
+_TRAINING_OUTPUT_EXAMPLE = json.dumps({"classification": "EXAMPLE_CLASSIFICATION", "component": "EXAMPLE_COMPONENT", "details": {"reason": "A human would write the reason here."}}, indent=2)
+_TRAINING_OUTPUT_TEMPLATE = json.dumps({"classification": "ENTER_CORRECT_CLASSIFICATION_HERE", "component": "ENTER_COMPONENT", "details": {"reason": "A human would write the reason here."}}, indent=2)
+
 def run_full_simulation():
     flow_log = ["🚀 Starting new simulation run..."]
-    data_service = DataContextService(); data_service.clear()
+    data_service = _DATA_SERVICE; data_service.clear()
     classifier_engine = ClassifierEngine(data_service, flow_log)
     decision_engine = DecisionEngine(classifier_engine, data_service, flow_log)
     action_executor = ActionExecutor(flow_log)
@@ -273,24 +385,14 @@ def run_full_simulation():
     ]
     
     for test in tests:
-        flow_log.append(f"--- Processing Test: {test.test_name} ---")
+        if _FLOW_LOG_ENABLED: flow_log.append(f"--- Processing Test: {test.test_name} ---")
         action_commands = decision_engine.process_test_result(test)
         action_results = [action_executor.execute_action(cmd) for cmd in action_commands]
         data_service.update_analysis(test.test_run_id, {"action_results": action_results})
     
     flow_log.append("✅ Simulation complete.")
     
-    final_results = []
-    for result in data_service.get_all_results():
-        result_dict = asdict(result)
-        if 'analysis' in result_dict and result_dict['analysis']:
-            if 'classifications' in result_dict['analysis']:
-                for c in result_dict['analysis']['classifications']:
-                    if isinstance(c.get('classification_type'), Enum): c['classification_type'] = c['classification_type'].value
-            if 'actions' in result_dict['analysis']:
-                for a in result_dict['analysis']['actions']:
-                    if isinstance(a.get('action_type'), Enum): a['action_type'] = a['action_type'].value
-        final_results.append(result_dict)
+    final_results = data_service.get_view_rows()
     
     instructlab_training_data = []
     for result in final_results:
@@ -299,44 +401,53 @@ def run_full_simulation():
             training_item = {
                 "instruction": "Classify the following test failure log based on the provided context.",
                 "input": f"Test Name: {result['test_name']}\nSuite: {result['suite']}\nFailed Step: {result['failed_step']}\n\n--- LOGS ---\n{result['logs']}",
-                "output": json.dumps({"classification": "EXAMPLE_CLASSIFICATION", "component": "EXAMPLE_COMPONENT", "details": {"reason": "A human would write the reason here."}}, indent=2)
+                "output": _TRAINING_OUTPUT_EXAMPLE
             }
             instructlab_training_data.append(training_item)
 
     return final_results, flow_log, instructlab_training_data
 
-def dashboard_view(request):
+DASHBOARD_CACHE_KEY = 'analysis:dashboard'
+DASHBOARD_CACHE_TIMEOUT = 60
+
+def _render_dashboard(request):
     test_results_data, flow_log, instructlab_data = run_full_simulation()
     context = {'test_results': test_results_data, 'flow_log': flow_log, 'instructlab_training_data': instructlab_data}
     return render(request, 'analysis/dashboard.html', context)
 
+_DASHBOARD_LOCK = threading.Lock()
+
+def dashboard_view(request):
+    refresh = request.GET.get('refresh') == '1'
+    response = None if refresh else cache.get(DASHBOARD_CACHE_KEY)
+    if response is not None: return response
+    with _DASHBOARD_LOCK:
+        response = None if refresh else cache.get(DASHBOARD_CACHE_KEY)
+        if response is None:
+            response = _render_dashboard(request)
+            cache.set(DASHBOARD_CACHE_KEY, response, DASHBOARD_CACHE_TIMEOUT)
+        return response
+
 def log_view(request, test_run_id):
-    data_service = DataContextService()
-    test_run = data_service.get_test_result(test_run_id)
-    if not test_run: raise Http404("Test run not found")
-    
-    result_dict = asdict(test_run)
-    if 'analysis' in result_dict:
-        if 'classifications' in result_dict['analysis']:
-            for c in result_dict['analysis']['classifications']:
-                if isinstance(c.get('classification_type'), Enum): c['classification_type'] = c['classification_type'].value
-                c['details_pretty'] = json.dumps(c.get('details', {}), indent=2)
-        if 'actions' in result_dict['analysis']:
-            for a in result_dict['analysis']['actions']:
-                if isinstance(a.get('action_type'), Enum): a['action_type'] = a['action_type'].value
+    data_service = _DATA_SERVICE
+    result_dict = data_service.get_view_row(test_run_id)
+    if not result_dict: raise Http404("Test run not found")
 
     instructlab_example = {
         "instruction": "Classify the following test failure log based on the provided context.",
         "input": f"Test Name: {result_dict['test_name']}\nSuite: {result_dict['suite']}\nFailed Step: {result_dict['failed_step']}\n\n--- LOGS ---\n{result_dict['logs']}",
-        "output": json.dumps({"classification": "ENTER_CORRECT_CLASSIFICATION_HERE", "component": "ENTER_COMPONENT", "details": {"reason": "A human would write the reason here."}}, indent=2)
+        "output": _TRAINING_OUTPUT_TEMPLATE
     }
     
     context = {'run': result_dict, 'instructlab_example': instructlab_example}
     return render(request, 'analysis/log_viewer.html', context)
 
+_CLASSIFICATION_TYPE_VALUES = tuple(sorted(e.value for e in ClassificationType))
+_ACTION_TYPE_VALUES = tuple(sorted(e.value for e in ActionType))
+
 def manage_view(request):
     context = {
-        'classification_types': sorted([e.value for e in ClassificationType]),
-        'action_types': sorted([e.value for e in ActionType])
+        'classification_types': _CLASSIFICATION_TYPE_VALUES,
+        'action_types': _ACTION_TYPE_VALUES
     }
     return render(request, 'analysis/manage.html', context)
@@ -58,3 +58,8 @@ USE_I18N = True
 USE_L10N = True
 USE_TZ = True
 STATIC_URL = '/static/'
+
+# Results kept in memory. The per-log step-parsing and classification caches use the same size,
+# so up to this many evicted log bodies can stay alive in each of them.
+ANALYSIS_SIMULATION_DB_MAX = 1000
+ANALYSIS_FLOW_LOG = os.environ.get('ANALYSIS_FLOW_LOG', '1') == '1'